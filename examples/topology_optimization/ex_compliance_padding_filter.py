@@ -51,7 +51,7 @@ if __name__ == "__main__":
         boundary_nodes = domain.nodes[0, ny//3:-ny//3].flatten()
 
         # Calculate boundary dof indices
-        boundary_dofs = np.repeat(boundary_nodes * ndof, ndof, axis=-1) + np.tile(np.arange(ndof), len(boundary_nodes))
+        boundary_dofs = domain.get_dofnumber(boundary_nodes, ndof=ndof).flatten()
 
         # Which dofs to put a force on? The 1 is added for a force in y-direction (x-direction would be zero)
         force_dofs = ndof * domain.nodes[nx, ny//2] + 1
@@ -59,7 +59,7 @@ if __name__ == "__main__":
         ndof = 3
         domain = pym.DomainDefinition(nx, ny, nz)
         boundary_nodes = domain.nodes[0, ny//3:-ny//3, nz//3:-nz//3].flatten()
-        boundary_dofs = np.repeat(boundary_nodes * ndof, ndof, axis=-1) + np.tile(np.arange(ndof), len(boundary_nodes))
+        boundary_dofs = domain.get_dofnumber(boundary_nodes, ndof=ndof).flatten()
         force_dofs = ndof * domain.nodes[nx, ny // 2, nz // 2] + 2  # Z-direction
 
     if domain.nnodes > 1e+6:
@@ -36,8 +36,9 @@ if __name__ == "__main__":
     domain = pym.DomainDefinition(nx, ny)
 
     # Node and dof groups
-    nodes_left = domain.get_nodenumber(0, np.arange(ny + 1))
-    nodes_right = domain.get_nodenumber(nx, np.arange(ny + 1))
+    yrange = np.arange(ny + 1)
+    nodes_left = domain.get_nodenumber(0, yrange)
+    nodes_right = domain.get_nodenumber(nx, yrange)
 
     dofs_right = domain.get_dofnumber(nodes_right, [0, 1], ndof=2).flatten()
     dofs_left_x = 2*nodes_left
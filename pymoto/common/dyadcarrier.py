@@ -3,6 +3,7 @@ import warnings
 import numpy as np
 from numpy.typing import NDArray
 from scipy.sparse import spmatrix, coo_matrix
+from scipy.linalg import get_blas_funcs
 from ..utils import _parse_to_list
 
 try:  # Import fast optimized einsum
@@ -208,8 +209,8 @@ class DyadCarrier(object):
                 raise ValueError(f"Inconsistent shapes {self.shape} and {other.shape}")
             return self.copy().__iadd__(other)
         elif isdense(other):
-            other = np.broadcast_to(other, self.shape)
-            return other + self.todense()
+            val = np.array(np.broadcast_to(other, self.shape), dtype=np.result_type(other, self.dtype))
+            return self.add_to(val)
         else:
             return NotImplemented
 
@@ -229,8 +230,8 @@ class DyadCarrier(object):
                 return -self.copy()
             raise NotImplementedError("subtracting a dyadcarrier from a nonzero scalar  is not supported")
         elif isdense(other):
-            other = np.broadcast_to(other, self.shape)
-            return other - self.todense()
+            val = np.array(np.broadcast_to(other, self.shape), dtype=np.result_type(other, self.dtype))
+            return self.add_to(val, fac=-1.0)
         else:
             return NotImplemented
 
@@ -251,11 +252,9 @@ class DyadCarrier(object):
     @property
     def real(self):
         """Returns a deep copy of the real part of the DyadCarrier"""
-        return DyadCarrier(
-            [*[u.real for u in self.u], *[-u.imag for u in self.u]],
-            [*[v.real for v in self.v], *[v.imag for v in self.v]],
-            shape=self.shape,
-        )
+        # The real and imaginary parts are views, which are only copied once on adding to the new DyadCarrier
+        dyad = DyadCarrier([u.real for u in self.u], [v.real for v in self.v], shape=self.shape)
+        return dyad.add_dyad([u.imag for u in self.u], [v.imag for v in self.v], fac=-1.0)
 
     @property
     def imag(self):
@@ -448,12 +447,42 @@ class DyadCarrier(object):
                 stacklevel=2,
             )
 
-        val = np.zeros((max(0, self.shape[0]), max(0, self.shape[1])), dtype=self.dtype)
+        if self.n_dyads == 0:
+            return np.zeros((max(0, self.shape[0]), max(0, self.shape[1])), dtype=self.dtype)
 
-        for ui, vi in zip(self.u, self.v):
-            val += np.outer(ui, vi)
+        # All dyads at once as a single matrix-matrix product U^T V
+        return np.array(self.u, dtype=self.dtype).T @ np.array(self.v, dtype=self.dtype)
 
-        return val
+    def add_to(self, A: NDArray, fac: float = 1.0):
+        r"""Adds the DyadCarrier to a dense matrix in-place :math:`\mathbf{A} \leftarrow \mathbf{A} + f \sum_k
+        \mathbf{u}_k\otimes\mathbf{v}_k`, without forming the full matrix of the DyadCarrier
+
+        The data type of ``A`` is preserved, so it must be able to hold all stored vectors. For instance, a single
+        precision matrix can only be updated if all vectors of the DyadCarrier are single precision as well.
+
+        Args:
+            A: The dense matrix of the same shape, which is modified in-place
+            fac (optional): Multiplication factor
+
+        Returns:
+            The updated matrix ``A``
+        """
+        if A.shape != self.shape:
+            raise ValueError(f"Inconsistent shapes {A.shape} and {self.shape}")
+        # Use the type of the stored vectors, as self.dtype is at least double precision
+        vec_dtype = np.result_type(A.dtype, *(ui.dtype for ui in self.u), *(vi.dtype for vi in self.v))
+        if vec_dtype != A.dtype:
+            raise TypeError(f"Cannot add DyadCarrier of type {vec_dtype} to matrix of type {A.dtype}")
+
+        if A.flags.c_contiguous and A.dtype.char in "fdFD":
+            # Rank-1 BLAS updates of the (Fortran-ordered) transpose, i.e. A^T += fac * v u^T
+            ger = get_blas_funcs("geru" if np.iscomplexobj(A) else "ger", (A,))
+            for ui, vi in zip(self.u, self.v):
+                ger(fac, vi, ui, a=A.T, overwrite_a=True)
+        else:
+            for ui, vi in zip(self.u, self.v):
+                A += fac * np.outer(ui, vi)
+        return A
 
     def toarray(self):
         """Convert to array, same as todense(). To be consistent with scipy.sparse"""
@@ -2,6 +2,7 @@ from pymoto import Module, DomainDefinition
 import numpy as np
 from scipy.sparse import coo_matrix
 from scipy.signal import convolve, correlate
+from scipy.fft import rfftn, irfftn, next_fast_len
 from numbers import Number
 
 
@@ -287,6 +288,12 @@ class DensityFilter(Filter):
     Output Signal:
         - ``y``: Filtered field :math:`\mathbf{y}`
 
+    Optionally (``use_fft=True``), the filter is evaluated as a zero-padded convolution using FFTs, which scales as
+    :math:`\mathcal{O}(N \log N)` instead of :math:`\mathcal{O}(N r^d)` for the sparse matrix :math:`\mathbf{H}`
+    and is therefore faster for larger filter radii. The row sums :math:`s_i` then equal the same convolution of a
+    field of ones. Note that the result contains round-off errors of the FFTs, so a non-negative field may be filtered
+    to small negative values (e.g. ``-1e-17``) where the sparse filter gives exactly ``0``.
+
     Args:
         domain (:py:class:`pymoto.DomainDefinition`): The finite element domain
 
@@ -295,6 +302,8 @@ class DensityFilter(Filter):
         nonpadding (numpy.array[int]): An array with indices at places where
           :math:`s_i = \max(\mathbf{s}) \: \forall\: i \notin \mathcal{N}`. For a density filter this mimics having
           values of ``0`` outside of the domain, thus emulating padding of the boundaries.
+        use_fft (bool): Use the FFT-based convolution instead of the sparse matrix :math:`\mathbf{H}`. In that case
+          ``H`` is not available (``None``) and ``Hs`` is a 1-D array.
 
     References:
       - Bruns & Tortorelli (2001). *Topology optimization of non-linear elastic structures and compliant mechanisms*.
@@ -304,6 +313,48 @@ class DensityFilter(Filter):
         Engineering, 50, 2143-2158. `doi: 10.1002/nme.116 <https://doi.org/10.1002/nme.116>`_
     """
 
+    def __init__(self, domain: DomainDefinition, radius=2.0, nonpadding=None, use_fft: bool = False):
+        self.use_fft = use_fft
+        if not self.use_fft:
+            super().__init__(domain, radius=radius, nonpadding=nonpadding)
+            return
+
+        self.H = None
+        self.shape = (max(domain.nelz, 1), domain.nely, domain.nelx)  # Element numbering is x-fastest
+
+        # Filter kernel, limited to the size of the domain
+        delem = [min(int(radius), n - 1) for n in self.shape]
+        dz, dy, dx = np.meshgrid(*[np.arange(-d, d + 1) for d in delem], indexing="ij")
+        kernel = np.maximum(0.0, radius - np.sqrt(dx * dx + dy * dy + dz * dz))
+
+        # The FFT size is large enough to prevent wrapping around of the (full) linear convolution
+        self._fft_shape = tuple(next_fast_len(n + 2 * d, real=True) for n, d in zip(self.shape, delem))
+        self._same_slice = tuple(slice(d, d + n) for n, d in zip(self.shape, delem))
+        self._kernel_fft = rfftn(kernel, s=self._fft_shape, workers=-1)
+
+        self.Hs = self._convolve(np.ones(domain.nel))
+        if nonpadding is not None:
+            inds = ~np.isin(np.arange(len(self.Hs)), nonpadding)
+            self.Hs[inds] = np.max(self.Hs)
+
+    def _convolve(self, x):
+        r"""Zero-padded convolution with the (symmetric) filter kernel, equivalent to :math:`\mathbf{H}\mathbf{x}`"""
+        if np.iscomplexobj(x):
+            return self._convolve(x.real) + 1j * self._convolve(x.imag)
+        x_fft = rfftn(x.reshape(self.shape), s=self._fft_shape, workers=-1)
+        y = irfftn(x_fft * self._kernel_fft, s=self._fft_shape, workers=-1)
+        return y[self._same_slice].flatten()
+
+    def __call__(self, x):
+        if not self.use_fft:
+            return Filter._orig_call(self, x)  # Unwrapped, to not overwrite the initialization location
+        return self._convolve(x) / self.Hs
+
+    def _sensitivity(self, dfdy):
+        if not self.use_fft:
+            return super()._sensitivity(dfdy)
+        return self._convolve(dfdy / self.Hs)  # The kernel is symmetric, so H^T = H
+
     @staticmethod
     def _calculate_h(domain: DomainDefinition, radius=2.0):
         """Density filter: Build (and assemble) the index+data vectors for the coo matrix format
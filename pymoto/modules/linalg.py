@@ -1,5 +1,6 @@
 """Specialized linear algebra modules"""
 
+import hashlib
 import warnings
 from typing import Callable
 
@@ -118,6 +119,20 @@ class Inverse(Module):
         return dA if np.iscomplexobj(A) else np.real(dA)
 
 
+def _matrix_fingerprint(A):
+    """Returns a hash of the contents of a dense or sparse matrix, to detect if the matrix has changed"""
+    if matrix_is_sparse(A):
+        arrays = [getattr(A, k) for k in ("data", "indices", "indptr", "row", "col", "offsets") if hasattr(A, k)]
+    elif isinstance(A, np.ndarray):
+        arrays = [A]
+    else:
+        return None  # Unknown matrix type, cannot be fingerprinted
+    h = hashlib.blake2b(digest_size=16)
+    for a in arrays:
+        h.update(np.ascontiguousarray(a).data)
+    return type(A), A.shape, A.dtype, h.digest()
+
+
 class LinSolve(Module):
     r"""Solves linear system of equations :math:`\mathbf{A}\mathbf{x}=\mathbf{b}`
 
@@ -140,7 +155,10 @@ class LinSolve(Module):
                  hermitian: bool = None, 
                  symmetric: bool = None, 
                  positive_definite: bool = None,
-                 solver: LinearSolver = None
+                 solver: LinearSolver = None,
+                 reuse_factorization: bool = True,
+                 single_precision: bool = False,
+                 num_threads: int = None,
                  ):
         """Initialize the linear solver module
 
@@ -153,22 +171,42 @@ class LinSolve(Module):
             positive_definite (bool, optional): Flag to specify if the matrix is positive definite
             solver (:py:class:`pymoto.solvers.LinearSolver`, optional): Manually override the linear solver used, 
               instead of the the solver from :func:`pymoto.solvers.auto_determine_solver`
+            reuse_factorization (bool, optional): Skip the (expensive) update of the solver in case the matrix is 
+              identical to the matrix of the previous response. Defaults to True.
+            single_precision (bool, optional): Factorize and solve in single precision, which reduces memory traffic
+              and may be sufficiently accurate for the intermediate iterations of an optimization. Solutions and 
+              sensitivities are still returned in double precision. The solver must support single precision (e.g. 
+              the scipy LU, dense and Pardiso solvers). Defaults to False.
+            num_threads (int, optional): Number of threads used by the automatically determined solver, in case it
+              supports multi-threading (:py:class:`pymoto.solvers.SolverSparsePardiso`). Defaults to the library 
+              default.
         """
         self.dep_tol = dep_tol
         self.ishermitian = hermitian
         self.issymmetric = symmetric
         self.ispositivedefinite = positive_definite
         self.solver = solver
+        self._prepared_solver = None  # The solver as set up by the first response
+        self.reuse_factorization = reuse_factorization
+        self._factorized = None  # Fingerprint of the matrix the solver is currently updated with
+        self.single_precision = single_precision
+        self.num_threads = num_threads
+        self._mat_kind = None  # Type and dtype of the matrix for which the detections have been done
         self.u = None  # Solution storage
 
     def __call__(self, mat, rhs):
-        # Do some detections on the matrix type
-        self.issparse = matrix_is_sparse(mat)  # Check if it is a sparse matrix
-        self.iscomplex = matrix_is_complex(mat)  # Check if it is a complex-valued matrix
+        # Do some detections on the matrix type, which are only repeated if the type or dtype of matrix changes
+        mat_kind = (type(mat), getattr(mat, "dtype", None))
+        if mat_kind != self._mat_kind:
+            self._mat_kind = mat_kind
+            self.issparse = matrix_is_sparse(mat)  # Check if it is a sparse matrix
+            self.iscomplex = matrix_is_complex(mat)  # Check if it is a complex-valued matrix
         if not self.iscomplex and self.issymmetric is not None:
             self.ishermitian = self.issymmetric
         if self.ishermitian is None:
             self.ishermitian = matrix_is_hermitian(mat)
+        if not self.iscomplex and self.issymmetric is None:
+            self.issymmetric = self.ishermitian  # Prevent the symmetry check being repeated in the solvers
         if self.issparse and not self.iscomplex and np.iscomplexobj(rhs):
             raise TypeError(
                 "Complex right-hand-side for a real-valued sparse matrix is not supported."
@@ -176,43 +214,94 @@ class LinSolve(Module):
                 "one for the imaginary."
             )  # FIXME
 
-        # Determine the solver we want to use
+        x0 = self.u
+        if self.single_precision:
+            mat, rhs = self._to_single(mat), self._to_single(rhs)
+            x0 = None if x0 is None else self._to_single(x0)
+
+        # Set up the solver on the first response, or in case it has been replaced
+        if self.solver is None or self.solver is not self._prepared_solver:
+            self._prepare_solver(mat)
+
+        # Update solver with new matrix, which is skipped if the matrix did not change since the previous update
+        fingerprint = _matrix_fingerprint(mat) if self.reuse_factorization else None
+        if fingerprint is None or (self.solver, fingerprint) != self._factorized:
+            self.solver.update(mat)
+            self._factorized = (self.solver, fingerprint)
+        elif isinstance(self.solver, LDAWrapper):
+            self.solver.clear()  # Only clear the stored solutions, the factorization can be reused
+
+        # Solution
+        self.u = self.solver.solve(rhs, x0=x0)
+        if self.single_precision:
+            self.u = self._to_double(self.u)
+
+        return self.u
+
+    @staticmethod
+    def _to_single(x):
+        """Convert a matrix or vector to single precision"""
+        return x.astype(np.complex64 if np.iscomplexobj(x) else np.float32, copy=False)
+
+    @staticmethod
+    def _to_double(x):
+        """Convert a matrix or vector to double precision"""
+        return x.astype(np.complex128 if np.iscomplexobj(x) else np.float64, copy=False)
+
+    def _prepare_solver(self, mat):
+        """Determine the solver we want to use (if not given) and wrap it in :class:`LDAWrapper` if requested"""
         if self.solver is None:
             self.solver = auto_determine_solver(mat, 
                                                 ishermitian=self.ishermitian, 
                                                 issymmetric=self.issymmetric, 
-                                                ispositivedefinite=self.ispositivedefinite)
+                                                ispositivedefinite=self.ispositivedefinite,
+                                                num_threads=self.num_threads)
         if not isinstance(self.solver, LDAWrapper) and self.use_lda_solver:
             lda_kwargs = dict(hermitian=self.ishermitian, symmetric=self.issymmetric)
             if hasattr(self.solver, "tol"):
                 lda_kwargs["tol"] = self.solver.tol * 5
+            if self.single_precision:  # The residual cannot get much lower than the machine precision
+                lda_kwargs["tol"] = max(lda_kwargs.get("tol", 0.0), 100 * np.finfo(np.float32).eps)
             self.solver = LDAWrapper(self.solver, **lda_kwargs)
+        self._prepared_solver = self.solver
 
-        # Update solver with new matrix
-        self.solver.update(mat)
+    def solve_adjoint(self, rhs):
+        r"""Solve the adjoint system :math:`\mathbf{A}^\text{T}\boldsymbol{\lambda} = \mathbf{b}` with the current
+        solver, in single precision if requested
 
-        # Solution
-        self.u = self.solver.solve(rhs, x0=self.u)
+        Args:
+            rhs: Right-hand side :math:`\mathbf{b}` of shape ``(n)`` or ``(n, Nrhs)``
 
-        return self.u
+        Returns:
+            Adjoint solution :math:`\boldsymbol{\lambda}`, in double precision
+        """
+        # lam = self.solver.solve(rhs.conj(), trans='H').conj()
+        if self.single_precision:
+            return self._to_double(self.solver.solve(self._to_single(rhs), trans="T"))
+        return self.solver.solve(rhs, trans="T")
 
     def _sensitivity(self, dfdv):
         mat, rhs = self.get_input_states()
-        # lam = self.solver.solve(dfdv.conj(), trans='H').conj()
-        lam = self.solver.solve(dfdv, trans="T")
+        lam = self.solve_adjoint(dfdv)
 
         if self.issparse:
+            # The negation is done while copying the vectors into the dyad, preventing an extra copy of -lam
             if self.u.ndim > 1:
-                dmat = DyadCarrier(list(-lam.T), list(self.u.T))
+                dmat = DyadCarrier().add_dyad(list(lam.T), list(self.u.T), fac=-1.0)
             else:
-                dmat = DyadCarrier(-lam, self.u)
+                dmat = DyadCarrier().add_dyad(lam, self.u, fac=-1.0)
+            if not self.iscomplex and dmat.iscomplex():
+                dmat = dmat.real
         else:
-            if self.u.ndim > 1:
-                dmat = np.einsum("iB,jB->ij", -lam, self.u, optimize=True)
-            else:
-                dmat = np.outer(-lam, self.u)
-        if not self.iscomplex:
-            dmat = dmat.real
+            # Matrix product of shapes (n, Nrhs) x (Nrhs, n), which also handles a single rhs as outer product
+            lam2 = -lam.reshape(lam.shape[0], -1)
+            u2 = self.u.reshape(self.u.shape[0], -1)
+            if self.iscomplex:
+                dmat = lam2 @ u2.T
+            else:  # Only calculate the real part for a real-valued matrix
+                dmat = lam2.real @ u2.real.T
+                if np.iscomplexobj(lam2) and np.iscomplexobj(u2):
+                    dmat -= lam2.imag @ u2.imag.T
 
         db = np.real(lam) if np.isrealobj(rhs) else lam
 
@@ -273,6 +362,50 @@ class SystemOfEquations(Module):
         self.p = prescribed
         if self.p is None and self.f is None:
             raise ValueError("Either prescribed or free indices must be provided")
+        self._partition_cache = None  # Sparsity pattern of the matrix and gather indices of its partitions
+
+    @staticmethod
+    def _complement_indices(idx, n):
+        """Get the (sorted) indices in ``range(n)`` that are not in ``idx``, without sorting ``idx`` itself"""
+        mask = np.ones(n, dtype=bool)
+        mask[idx] = False
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def _as_index_array(idx, n):
+        """Convert the indices to a contiguous integer array, using 32-bit integers if possible for faster gathers"""
+        dtype = np.int32 if n < 2**31 else np.intp
+        return np.ascontiguousarray(idx, dtype=dtype)
+
+    def _partition(self, A):
+        """Partition the matrix into the blocks ``Aff``, ``Afp`` and ``App``
+
+        For compressed sparse (CSR or CSC) matrices, the gather indices of the blocks are cached. As long as the 
+        sparsity pattern of the matrix does not change, only its nonzero values need to be copied into the blocks.
+        """
+        blocks = ((self.f, self.f), (self.f, self.p), (self.p, self.p))
+        if not (matrix_is_sparse(A) and A.format in ("csr", "csc") and A.has_canonical_format):
+            return tuple(A[rows, :][:, cols] for rows, cols in blocks)
+
+        cache = self._partition_cache
+        if (
+            cache is None
+            or cache[0] is not type(A)
+            or cache[1] != A.shape
+            or not np.array_equal(cache[2], A.indptr)
+            or not np.array_equal(cache[3], A.indices)
+        ):
+            # Partition a matrix with the position of each nonzero as its value to obtain the gather indices
+            pattern = type(A)((np.arange(1, A.nnz + 1), A.indices, A.indptr), shape=A.shape)
+            gathers = []
+            for rows, cols in blocks:
+                B = pattern[rows, :][:, cols]
+                B.sort_indices()  # Prevents the solvers from re-ordering the shared index arrays
+                gathers.append((B.data - 1, B.indices, B.indptr, B.shape))
+            cache = (type(A), A.shape, A.indptr.copy(), A.indices.copy(), gathers)
+            self._partition_cache = cache
+
+        return tuple(type(A)((A.data[g], indices, indptr), shape=shape) for g, indices, indptr, shape in cache[4])
 
     def __call__(self, A, bf, xp):
         n = A.shape[0]
@@ -281,11 +414,11 @@ class SystemOfEquations(Module):
         assert bf.ndim == xp.ndim, "Number of loadcases for applied force and displacement must match"
 
         if self.f is None:
-            all_dofs = np.arange(n)
-            self.f = np.setdiff1d(all_dofs, self.p)
+            self.f = self._complement_indices(self.p, n)
         if self.p is None:
-            all_dofs = np.arange(n)
-            self.p = np.setdiff1d(all_dofs, self.f)
+            self.p = self._complement_indices(self.f, n)
+        self.f = self._as_index_array(self.f, n)
+        self.p = self._as_index_array(self.p, n)
         assert self.f.size + self.p.size == n, "Size of free and prescribed indices must match the matrix size"
 
         # create empty output
@@ -296,9 +429,7 @@ class SystemOfEquations(Module):
         b[self.f, ...] = bf
 
         # partitioning
-        Aff = A[self.f, :][:, self.f]
-        self.Afp = A[self.f, :][:, self.p]
-        self.App = A[self.p, :][:, self.p]
+        Aff, self.Afp, self.App = self._partition(A)
 
         # solve
         self.linsolve.sig_in[0].state = Aff
@@ -321,7 +452,7 @@ class SystemOfEquations(Module):
             adjoint_load += self.Afp * dgdb[self.p, ...]
 
         lam = np.zeros_like(self.x)
-        lamf = -1.0 * self.linsolve.solver.solve(adjoint_load, trans="T")
+        lamf = -1.0 * self.linsolve.solve_adjoint(adjoint_load)
         lam[self.f, ...] = lamf
 
         if dgdb is not None:
@@ -3,6 +3,8 @@ from .matrix_checks import (
     matrix_is_sparse,
     matrix_is_complex,
     matrix_is_diagonal,
+    matrix_is_lower_triangular,
+    matrix_is_upper_triangular,
     matrix_is_symmetric,
     matrix_is_hermitian,
     matrix_is_positive_definite,
@@ -16,6 +18,8 @@ __all__ = [
     "matrix_is_sparse",
     "matrix_is_complex",
     "matrix_is_diagonal",
+    "matrix_is_lower_triangular",
+    "matrix_is_upper_triangular",
     "matrix_is_symmetric",
     "matrix_is_hermitian",
     "matrix_is_positive_definite",
@@ -1,12 +1,13 @@
 import warnings
-import numpy as np
 import scipy.sparse as sps
-from inspect import currentframe, getframeinfo
 
 from .dense import SolverDenseQR, SolverDenseCholesky, SolverDenseLDL, SolverDenseLU, SolverDiagonal
 from .sparse import SolverSparseLU, SolverSparseCholeskyScikit, SolverSparseCholeskyCVXOPT, SolverSparsePardiso
 from .matrix_checks import (
+    matrix_is_complex,
     matrix_is_diagonal,
+    matrix_is_lower_triangular,
+    matrix_is_upper_triangular,
     matrix_is_sparse,
     matrix_is_hermitian,
     matrix_is_symmetric,
@@ -23,6 +24,7 @@ def auto_determine_solver(
     ishermitian=None,
     issymmetric=None,
     ispositivedefinite=None,
+    num_threads=None,
 ):
     """
     Uses parts of Matlab's scheme https://nl.mathworks.com/help/matlab/ref/mldivide.html
@@ -33,6 +35,7 @@ def auto_determine_solver(
     :param ishermitian: Override for hermitian matrix (prevents check)
     :param issymmetric: Override for symmetric matrix (prevents check). Is the same as hermitian for a real matrix
     :param ispositivedefinite: Manual override for positive definiteness
+    :param num_threads: Number of threads for the solvers that support it (Pardiso), default is the library default
     :return: LinearSolver which should be 'best' for the matrix
     """
     issparse = matrix_is_sparse(A)  # Check if the matrix is sparse
@@ -40,7 +43,7 @@ def auto_determine_solver(
 
     if not issquare:
         if issparse:
-            sps.SparseEfficiencyWarning("Only a dense version of QR solver is available")  # TODO
+            warnings.warn("Only a dense version of QR solver is available", sps.SparseEfficiencyWarning, stacklevel=2)
         return SolverDenseQR()
 
     # l_bw, u_bw = spla.bandwidth(A) # TODO Get bandwidth (implemented in scipy version > 1.8.0)
@@ -51,39 +54,8 @@ def auto_determine_solver(
     if isdiagonal:
         return SolverDiagonal()
 
-    # Check if the matrix is triangular
-    # TODO Currently only for dense matrices
-    if islowertriangular is None:  # Check if matrix is lower triangular
-        islowertriangular = False if issparse else np.allclose(A, np.tril(A))
-    if islowertriangular:
-        warnings.WarningMessage(
-            "Lower triangular solver not implemented",
-            UserWarning,
-            getframeinfo(currentframe()).filename,
-            getframeinfo(currentframe()).lineno,
-        )
-
-    if isuppertriangular is None:  # Check if matrix is upper triangular
-        isuppertriangular = False if issparse else np.allclose(A, np.triu(A))
-    if isuppertriangular:
-        warnings.WarningMessage(
-            "Upper triangular solver not implemented",
-            UserWarning,
-            getframeinfo(currentframe()).filename,
-            getframeinfo(currentframe()).lineno,
-        )
-
-    ispermutedtriangular = False
-    if ispermutedtriangular:
-        warnings.WarningMessage(
-            "Permuted triangular solver not implemented",
-            UserWarning,
-            getframeinfo(currentframe()).filename,
-            getframeinfo(currentframe()).lineno,
-        )
-
     # Check if the matrix is complex-valued
-    iscomplex = np.iscomplexobj(A)
+    iscomplex = matrix_is_complex(A)
     if iscomplex:
         # Detect if the matrix is hermitian and/or symmetric
         if ishermitian is None:
@@ -102,6 +74,20 @@ def auto_determine_solver(
         elif issymmetric is None:
             issymmetric = ishermitian
 
+    # Check if the matrix is triangular
+    # TODO Currently only for dense matrices
+    # A symmetric or hermitian matrix that is not diagonal cannot be triangular, so the checks are skipped
+    skip_triangular = issparse or issymmetric or ishermitian
+    if islowertriangular is None:  # Check if matrix is lower triangular
+        islowertriangular = False if skip_triangular else matrix_is_lower_triangular(A)
+    if islowertriangular:
+        warnings.warn("Lower triangular solver not implemented", UserWarning, stacklevel=2)
+
+    if isuppertriangular is None:  # Check if matrix is upper triangular
+        isuppertriangular = False if skip_triangular else matrix_is_upper_triangular(A)
+    if isuppertriangular:
+        warnings.warn("Upper triangular solver not implemented", UserWarning, stacklevel=2)
+
     # Check for positive-definiteness TODO: This test does not work yet
     # if ispositivedefinite is None:
     # ispositivedefinite = matrix_is_positive_definite(A)
@@ -110,7 +96,10 @@ def auto_determine_solver(
         # Prefer Intel Pardiso solver as it can solve any matrix
         if SolverSparsePardiso.defined:
             return SolverSparsePardiso(
-                symmetric=issymmetric, hermitian=ishermitian, positive_definite=ispositivedefinite
+                symmetric=issymmetric,
+                hermitian=ishermitian,
+                positive_definite=ispositivedefinite,
+                num_threads=num_threads,
             )
 
         if ishermitian and ispositivedefinite:
@@ -142,12 +142,13 @@ class SolverDenseCholesky(LinearSolver):
         # TODO When Cholesky factorization A = U^T U is used, symmetric complex matrices can also be solved, but this is
         #  not implemented in scipy
         if self.success:
+            # The forward and backward substitutions are done in a single LAPACK call (potrs)
             if trans == "N" or trans == "H":
                 # A = U^H U -> A^-1 = U^-1 U^-H
-                return spla.solve_triangular(self.U, spla.solve_triangular(self.U, rhs, trans="C"))
+                return spla.cho_solve((self.U, False), rhs, check_finite=False)
             elif trans == "T":
-                # A^T = U^T conj(U) -> A^-T = conj(U^-1) U^-T
-                return spla.solve_triangular(self.U, spla.solve_triangular(self.U, rhs, trans="T").conj()).conj()
+                # A^T = U^T conj(U) -> A^-T = conj(U^-1 U^-H conj(b))
+                return spla.cho_solve((self.U, False), rhs.conj(), check_finite=False).conj()
             else:
                 raise TypeError("Only N, T, and H transposition is possible")
         else:
@@ -22,6 +22,8 @@ def matrix_is_complex(A):
     """Checks if the matrix is complex"""
     if is_cvxopt_spmatrix(A):
         return A.typecode == "z"
+    elif isinstance(getattr(A, "dtype", None), np.dtype):
+        return A.dtype.kind == "c"
     else:
         return np.iscomplexobj(A)
 
@@ -39,6 +41,52 @@ def matrix_is_diagonal(A):
         return np.allclose(A, np.diag(np.diag(A)))
 
 
+def _offdiagonals_are_zero(A, offsets, atol=1e-8):
+    """Checks the given off-diagonals of a dense matrix one-by-one, exiting early at the first nonzero diagonal"""
+    return all(np.all(np.abs(np.diagonal(A, k)) <= atol) for k in offsets)
+
+
+def matrix_is_lower_triangular(A):
+    """Checks whether a matrix is numerically lower triangular"""
+    if matrix_is_sparse(A):
+        return np.allclose(sps.triu(A, k=1).data, 0)
+    else:
+        return _offdiagonals_are_zero(np.asarray(A), range(1, A.shape[1]))
+
+
+def matrix_is_upper_triangular(A):
+    """Checks whether a matrix is numerically upper triangular"""
+    if matrix_is_sparse(A):
+        return np.allclose(sps.tril(A, k=-1).data, 0)
+    else:
+        return _offdiagonals_are_zero(np.asarray(A), range(-1, -A.shape[0], -1))
+
+
+def _dense_is_close_to_transpose(A, conj=False, block_elements=2**20, rtol=1e-5, atol=1e-8):
+    """Compares a dense matrix with its (conjugate) transpose, in blocks of rows of the upper triangular part.
+
+    The result equals that of ``np.allclose(A, A.T)``, so each pair of entries is compared with the relative tolerance
+    in both directions. However, only half of the pairs are compared, no temporaries of the full matrix size are
+    created, and the comparison exits early at the first block that does not match.
+    """
+    A = np.asarray(A)
+    n = A.shape[0]
+    if A.ndim != 2 or n != A.shape[1]:
+        return False
+    block_size = max(1, block_elements // max(n, 1))
+    for i in range(0, n, block_size):
+        rows = A[i : i + block_size, i:]
+        cols = A[i:, i : i + block_size].T
+        if conj:
+            cols = cols.conj()
+        # Tolerance of ``np.isclose`` in both directions, with equal entries (e.g. infinities) always being close
+        with np.errstate(invalid="ignore"):
+            close = np.abs(rows - cols) <= atol + rtol * np.minimum(np.abs(rows), np.abs(cols))
+        if not np.all(close | (rows == cols)):
+            return False
+    return True
+
+
 def matrix_is_symmetric(A):
     """Checks whether a matrix is numerically symmetric"""
     if matrix_is_sparse(A):
@@ -46,7 +94,7 @@ def matrix_is_symmetric(A):
     elif is_cvxopt_spmatrix(A):
         return np.isclose(max(abs(A - A.T)), 0.0)
     else:
-        return np.allclose(A, A.T)
+        return _dense_is_close_to_transpose(A)
 
 
 def matrix_is_hermitian(A):
@@ -57,7 +105,7 @@ def matrix_is_hermitian(A):
         elif is_cvxopt_spmatrix(A):
             return np.isclose(max(abs(A - A.ctrans())), 0.0)
         else:
-            return np.allclose(A, A.T.conj())
+            return _dense_is_close_to_transpose(A, conj=True)
     else:
         return matrix_is_symmetric(A)
 
@@ -66,7 +114,7 @@ def matrix_is_positive_definite(A):
     """Check if the matrix is positive definite.
 
     Performs a couple of simple tests for positive definiteness:
-     - If any of the diagonal is negative or complex, the matrix is not positive definite
+     - If any of the diagonal is negative, the matrix is not positive definite
      - If all Gershgorin circles are positive, the matrix is positive definite
 
     Returns `None` in case these simple test are inconclusive
@@ -74,11 +122,12 @@ def matrix_is_positive_definite(A):
     # The hermitian/symmetric part of the matrix determines positive definiteness
     Aherm = (A + A.conj().T) / 2
 
-    # If any of the diagonal is negative or complex, the matrix is not positive definite
-    if Aherm.diagonal().real.min() < 0 or np.abs(np.angle(Aherm.diagonal())).max() > 1e-15:
-        return False
+    # The diagonal of the hermitian part is real-valued, so only a single reduction is required to check its sign
+    Adiag = Aherm.diagonal().real
 
-    Adiag = np.diag(Aherm)
+    # If any of the diagonal is negative, the matrix is not positive definite
+    if Adiag.min() < 0:
+        return False
 
     # https://math.stackexchange.com/questions/87528/a-practical-way-to-check-if-a-matrix-is-positive-definite
     # Test with Gershgorin circle theorem
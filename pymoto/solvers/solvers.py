@@ -145,17 +145,22 @@ class LDAWrapper(LinearSolver):
         if self.hermitian is None:
             if not matrix_is_complex(A):
                 self.hermitian = self.symmetric
-            self.hermitian = matrix_is_hermitian(A)
+            else:
+                self.hermitian = matrix_is_hermitian(A)
 
         self.A = A
         diags = get_diagonal_indices(A)
         self.diagonal_idx = np.argwhere(diags).flatten()
         self.nondiagonal_idx = np.argwhere(~diags).flatten()
+        self.clear()
+        self.solver.update(A)
+
+    def clear(self):
+        """Clear the internal stored solution vectors, without updating the internal ``solver``"""
         self.x_stored.clear()
         self.b_stored.clear()
         self.xadj_stored.clear()
         self.badj_stored.clear()
-        self.solver.update(A)
 
     def _do_solve_1rhs(self, A, rhs, x_data, b_data, solve_fn, x0=None):
         isel = self.nondiagonal_idx
@@ -179,7 +184,8 @@ class LDAWrapper(LinearSolver):
         for x, b in zip(x_data, b_data):
             assert x.ndim == b.ndim == 1
             # assert x.size == b.size == rhs_loc.shape[0]
-            alpha = rhs_loc[isel, ...].T @ b.conj() / (b.conj() @ b)
+            bc = b.conj() if np.iscomplexobj(b) else b  # Only allocate a conjugated copy if it is complex
+            alpha = rhs_loc[isel, ...].T @ bc / np.vdot(b, b)
 
             rem_rhs = alpha * b[:, None]
             add_sol = alpha * x[:, None]
@@ -215,8 +221,9 @@ class LDAWrapper(LinearSolver):
                     x0_loc = x0[..., self._did_solve].copy()
                 x0_loc[idia, ...] = 0
                 for x in x_data:
-                    beta = x0_loc[isel, ...].T @ x.conj() / (x.conj() @ x)
-                    x0_loc[isel, ...] -= beta * x
+                    xc = x.conj() if np.iscomplexobj(x) else x
+                    beta = x0_loc[isel, ...].T @ xc / np.vdot(x, x)
+                    x0_loc[isel, ...] -= beta * x[:, None]
             else:
                 x0_loc = None
 
@@ -228,13 +235,14 @@ class LDAWrapper(LinearSolver):
             else:
                 sol[np.ix_(isel, self._did_solve)] += xnew[isel, ...]
 
-            # Add to database
+            # Add to database, with the right-hand-sides of all new solutions obtained in one (batched) product
+            bnew = (A @ xnew)[isel, ...]
             for i in range(xnew.shape[-1]):
                 # Remove all previous components that are already in the database (orthogonalize)
                 xadd = xnew[isel, i]
-                badd = (A @ xnew[..., i])[isel, ...]
+                badd = bnew[:, i].copy()  # Contiguous, and not referencing the full block of right-hand-sides
                 for x, b in zip(x_data, b_data):
-                    beta = badd @ b.conj() / (b.conj() @ b)
+                    beta = np.vdot(b, badd) / np.vdot(b, b)
                     badd -= beta * b
                     xadd -= beta * x
                 bnrm = np.linalg.norm(badd)
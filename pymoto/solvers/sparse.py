@@ -169,6 +169,7 @@ class SolverSparsePardiso(LinearSolver):
         hermitian: bool = None,
         positive_definite: bool = None,
         size_limit_storage: int = 5e7,
+        num_threads: int = None,
     ):
         """Initialize Pardiso linear solver
 
@@ -178,6 +179,8 @@ class SolverSparsePardiso(LinearSolver):
             hermitian (bool, optional): If it is already known if the matrix is Hermitian, you can provide it here
             positive_definite (bool, optional): If positive-definiteness is known, provide it here
             size_limit_storage (int, optional): Limit for MKL memory use
+            num_threads (int, optional): Number of threads used by Pardiso. The previous (thread-local) MKL setting is
+              restored after each call to Pardiso. Defaults to None, which uses the MKL default.
         """
 
         if not self.defined:
@@ -216,6 +219,11 @@ class SolverSparsePardiso(LinearSolver):
 
         self._mkl_pardiso.restype = None
 
+        self.num_threads = num_threads
+        self._mkl_set_num_threads_local = libmkl.MKL_Set_Num_Threads_Local
+        self._mkl_set_num_threads_local.argtypes = [ctypes.c_int]
+        self._mkl_set_num_threads_local.restype = ctypes.c_int
+
         self._pt = np.zeros(64, dtype=self._pt_type[1])
         self._iparm = IparmOptions()
         self._perm = np.zeros(0, dtype=np.int32)
@@ -392,24 +400,30 @@ class SolverSparsePardiso(LinearSolver):
         else:
             c_data_p = ctypes.POINTER(ctypes.c_double)
 
-        self._mkl_pardiso(
-            self._pt.ctypes.data_as(ctypes.POINTER(self._pt_type[0])),  # pt
-            ctypes.byref(ctypes.c_int32(1)),  # maxfct
-            ctypes.byref(ctypes.c_int32(1)),  # mnum
-            ctypes.byref(ctypes.c_int32(self._mtype)),  # mtype
-            ctypes.byref(ctypes.c_int32(self._phase)),  # phase
-            ctypes.byref(ctypes.c_int32(A.shape[0])),  # N -> number of equations/size of matrix
-            A.data.ctypes.data_as(c_data_p),  # A -> non-zero entries in matrix
-            A.indptr.ctypes.data_as(c_int32_p),  # ia -> csr-indptr
-            A.indices.ctypes.data_as(c_int32_p),  # ja -> csr-indices
-            self._perm.ctypes.data_as(c_int32_p),  # perm -> empty
-            ctypes.byref(ctypes.c_int32(1 if b.ndim == 1 else b.shape[1])),  # nrhs
-            self._iparm.data.ctypes.data_as(c_int32_p),  # iparm-array
-            ctypes.byref(ctypes.c_int32(self._msglvl)),  # msg-level -> 1: statistical info is printed
-            b.ctypes.data_as(c_data_p),  # b -> right-hand side vector/matrix
-            x.ctypes.data_as(c_data_p),  # x -> output
-            ctypes.byref(pardiso_error),
-        )  # pardiso error
+        if self.num_threads is not None:
+            prev_num_threads = self._mkl_set_num_threads_local(int(self.num_threads))
+        try:
+            self._mkl_pardiso(
+                self._pt.ctypes.data_as(ctypes.POINTER(self._pt_type[0])),  # pt
+                ctypes.byref(ctypes.c_int32(1)),  # maxfct
+                ctypes.byref(ctypes.c_int32(1)),  # mnum
+                ctypes.byref(ctypes.c_int32(self._mtype)),  # mtype
+                ctypes.byref(ctypes.c_int32(self._phase)),  # phase
+                ctypes.byref(ctypes.c_int32(A.shape[0])),  # N -> number of equations/size of matrix
+                A.data.ctypes.data_as(c_data_p),  # A -> non-zero entries in matrix
+                A.indptr.ctypes.data_as(c_int32_p),  # ia -> csr-indptr
+                A.indices.ctypes.data_as(c_int32_p),  # ja -> csr-indices
+                self._perm.ctypes.data_as(c_int32_p),  # perm -> empty
+                ctypes.byref(ctypes.c_int32(1 if b.ndim == 1 else b.shape[1])),  # nrhs
+                self._iparm.data.ctypes.data_as(c_int32_p),  # iparm-array
+                ctypes.byref(ctypes.c_int32(self._msglvl)),  # msg-level -> 1: statistical info is printed
+                b.ctypes.data_as(c_data_p),  # b -> right-hand side vector/matrix
+                x.ctypes.data_as(c_data_p),  # x -> output
+                ctypes.byref(pardiso_error),
+            )  # pardiso error
+        finally:
+            if self.num_threads is not None:
+                self._mkl_set_num_threads_local(prev_num_threads)
 
         if pardiso_error.value != 0:
             raise PardisoError(pardiso_error.value)
@@ -412,6 +412,53 @@ class TestDyadCarrier:
         zer += pym.DyadCarrier(np.random.rand(n), np.random.rand(n))
         assert isinstance(zer, pym.DyadCarrier)
 
+    def test_add_to(self):
+        n, m = 10, 8
+        u1, u2 = np.random.rand(n), np.random.rand(n) + 1j * np.random.rand(n)
+        v1, v2 = np.random.rand(m), np.random.rand(m)
+
+        a = pym.DyadCarrier([u1], [v1])
+        A = np.random.rand(n, m)
+        Achk = A + 2.5 * np.outer(u1, v1)
+        Ares = a.add_to(A, fac=2.5)
+        assert Ares is A  # In-place
+        npt.assert_allclose(A, Achk)
+
+        # Fortran-ordered matrix
+        A = np.asfortranarray(np.random.rand(n, m))
+        Achk = A - np.outer(u1, v1)
+        npt.assert_allclose(a.add_to(A, fac=-1.0), Achk)
+
+        # Complex
+        b = pym.DyadCarrier([u1, u2], [v1, v2])
+        B = np.random.rand(n, m) + 1j * np.random.rand(n, m)
+        Bchk = B + np.outer(u1, v1) + np.outer(u2, v2)
+        npt.assert_allclose(b.add_to(B), Bchk)
+
+        # Complex dyad cannot be added to real matrix
+        with pytest.raises(TypeError):
+            b.add_to(np.random.rand(n, m))
+
+        # Single precision
+        for dtype in [np.float32, np.complex64]:
+            c = pym.DyadCarrier([u1.astype(dtype), u2.astype(np.complex64)], [v1.astype(dtype), v2.astype(dtype)])
+            C = np.random.rand(n, m).astype(np.complex64)
+            Cchk = C + 2.0 * c.todense()
+            Cres = c.add_to(C, fac=2.0)
+            assert Cres.dtype == np.complex64
+            npt.assert_allclose(Cres, Cchk, rtol=1e-5)
+
+        a32 = pym.DyadCarrier([u1.astype(np.float32)], [v1.astype(np.float32)])
+        for order in ['C', 'F']:
+            A = np.asarray(np.random.rand(n, m), dtype=np.float32, order=order)
+            Achk = A + np.outer(u1, v1)
+            assert a32.add_to(A) is A
+            npt.assert_allclose(A, Achk, rtol=1e-5)
+
+        # Double precision dyad cannot be added to single precision matrix
+        with pytest.raises(TypeError):
+            a.add_to(np.random.rand(n, m).astype(np.float32))
+
     def test_dot(self):
         n = 10
         dyads = self.setup_dyads(n, complex=True, nonsquare=True, empty=False)
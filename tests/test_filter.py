@@ -247,5 +247,44 @@ class TestConvolutionFilter:
         npt.assert_allclose(abs(sy1.state - sy2.state).min(), 0.0, atol=1e-4)
 
 
+
+class TestDensityFilter:
+    @pytest.mark.parametrize('domain', [pym.DomainDefinition(30, 20), pym.DomainDefinition(9, 7, 5)])
+    @pytest.mark.parametrize('radius', [1.5, 3, 4.5])
+    @pytest.mark.parametrize('nonpadding', [False, True])
+    def test_fft_matches_sparse(self, domain, radius, nonpadding):
+        """ The FFT-based convolution must equal the sparse filter matrix, including the boundaries """
+        np.random.seed(0)
+        pad = np.arange(0, domain.nel, 3) if nonpadding else None
+        m_sparse = pym.DensityFilter(domain, radius=radius, nonpadding=pad, use_fft=False)
+        m_fft = pym.DensityFilter(domain, radius=radius, nonpadding=pad, use_fft=True)
+        assert m_fft.H is None
+
+        sx = pym.Signal('x', state=np.random.rand(domain.nel))
+        sy_sparse, sy_fft = m_sparse(sx), m_fft(sx)
+        npt.assert_allclose(sy_fft.state, sy_sparse.state, rtol=1e-12, atol=1e-14)
+
+        dy = np.random.rand(domain.nel)
+        npt.assert_allclose(m_fft._sensitivity(dy), m_sparse._sensitivity(dy), rtol=1e-12, atol=1e-14)
+
+        pym.finite_difference(sx, sy_fft, test_fn=fd_testfn, verbose=False)
+
+    def test_fft_default(self):
+        domain = pym.DomainDefinition(10, 10)
+        m = pym.DensityFilter(domain, radius=3)
+        assert not m.use_fft
+        assert m.H is not None
+
+    @pytest.mark.parametrize('use_fft', [False, True])
+    def test_init_loc(self, use_fft):
+        """ The location in error messages must point to the user code, not to the library """
+        sx = pym.Signal('x', state=np.random.rand(100))
+        m = pym.DensityFilter(pym.DomainDefinition(10, 10), radius=2, use_fft=use_fft)
+        m(sx)
+        assert __file__ in m._init_loc
+        m.response()
+        assert __file__ in m._init_loc
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
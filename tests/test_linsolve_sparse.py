@@ -2,7 +2,8 @@ import pytest
 import numpy as np
 import pymoto as pym
 import numpy.testing as npt
-from scipy.sparse import csc_matrix
+from scipy.sparse import csc_matrix, csr_matrix
+import scipy.sparse as sp
 
 
 class DynamicMatrix(pym.Module):
@@ -115,6 +116,71 @@ class TestLinSolveModuleSparse:
         # Check finite difference
         pym.finite_difference(tosig=su, test_fn=self.fd_testfn, dx=1e-7, tol=1e-4, verbose=False)
 
+    def test_reuse_factorization(self):
+        """ Test the solver is only updated when the matrix changes """
+        class CountingSolver(pym.solvers.SolverSparseLU):
+            n_updates = 0
+
+            def update(self, A):
+                self.n_updates += 1
+                return super().update(A)
+
+        N = 4
+        dom = pym.DomainDefinition(N, N)
+        np.random.seed(0)
+        sx = pym.Signal('x', np.random.rand(dom.nel))
+        fixed_nodes = dom.get_nodenumber(0, np.arange(0, N+1))
+        bc = np.concatenate((fixed_nodes*2, fixed_nodes*2+1))
+        sf = pym.Signal('f', np.zeros(dom.nnodes*2))
+        sf.state[dom.get_nodenumber(N, np.arange(0, N+1))*2 + 1] = 1.0
+
+        sK = pym.AssembleStiffness(dom, bc=bc)(sx)
+        solver = CountingSolver()
+        m_solve = pym.LinSolve(solver=solver)
+        su = m_solve(sK, sf)
+        assert solver.n_updates == 1
+
+        # Same matrix, different rhs
+        sf.state = 2 * sf.state
+        m_solve.response()
+        assert solver.n_updates == 1
+        npt.assert_allclose(sK.state@su.state, sf.state, atol=1e-10)
+
+        # Changed matrix
+        sK.state = 2 * sK.state
+        m_solve.response()
+        assert solver.n_updates == 2
+        npt.assert_allclose(sK.state@su.state, sf.state, atol=1e-10)
+
+        # Reuse disabled
+        m_solve.reuse_factorization = False
+        m_solve.response()
+        assert solver.n_updates == 3
+
+    def test_single_precision(self):
+        """ Test the single-precision solve against the double-precision solution and sensitivities """
+        N = 10
+        dom = pym.DomainDefinition(N, N)
+        np.random.seed(0)
+        sx = pym.Signal('x', np.random.rand(dom.nel))
+        fixed_nodes = dom.get_nodenumber(0, np.arange(0, N+1))
+        bc = np.concatenate((fixed_nodes*2, fixed_nodes*2+1))
+        sf = pym.Signal('f', np.zeros(dom.nnodes*2))
+        sf.state[dom.get_nodenumber(N, np.arange(0, N+1))*2 + 1] = 1.0
+
+        sK = pym.AssembleStiffness(dom, bc=bc)(sx)
+        m_double, m_single = pym.LinSolve(), pym.LinSolve(single_precision=True)
+        su_double, su_single = m_double(sK, sf), m_single(sK, sf)
+        assert su_single.state.dtype == np.float64
+        npt.assert_allclose(su_single.state, su_double.state, rtol=1e-4)
+
+        # Sensitivities are returned in double precision as well
+        dK_double, df_double = m_double._sensitivity(sf.state)
+        dK_single, df_single = m_single._sensitivity(sf.state)
+        assert df_single.dtype == np.float64
+        npt.assert_allclose(df_single, df_double, rtol=1e-4)
+        npt.assert_allclose(dK_single.todense(), dK_double.todense(), rtol=1e-4, atol=1e-8)
+
 
 class TestAssemblyAddValues:
     @staticmethod
@@ -248,6 +314,58 @@ class TestSystemOfEquations:
 
         pym.finite_difference([sx, sff, sup], sc, test_fn=self.fd_testfn, dx=1e-5, tol=1e-4, verbose=False)
 
+    @pytest.mark.parametrize('fmt', [csc_matrix, csr_matrix])
+    def test_sparse_symmetric_real_compliance2d_single_precision(self, fmt):
+        """ Test single-precision solves of a symmetric real sparse matrix (compliance in 2D)"""
+        np.random.seed(0)
+        N = 3
+        domain = pym.DomainDefinition(N, N)
+
+        # Left side clamped, with prescribed vertical displacement
+        nodes_left = domain.get_nodenumber(0, np.arange(N + 1))
+        dofs_left = domain.get_dofnumber(nodes_left, ndof=2).flatten()
+        dofs_left_vertical = dofs_left[1::2]
+
+        all_dofs = np.arange(0, 2 * domain.nnodes)
+        prescribed_dofs = np.unique(dofs_left)
+        free_dofs = np.setdiff1d(all_dofs, prescribed_dofs)
+
+        u = np.zeros_like(all_dofs, dtype=float)
+        u[dofs_left_vertical] = np.random.rand(len(dofs_left_vertical))
+        sff = pym.Signal('ff', np.random.rand(len(free_dofs)))
+        sup = pym.Signal('up', u[prescribed_dofs])
+
+        sx = pym.Signal('x', 0.1 + 0.9 * np.random.rand(domain.nel))
+        with pym.Network() as fn:
+            sK = pym.AssembleStiffness(domain, matrix_type=fmt)(sx)
+            su = pym.SystemOfEquations(prescribed=prescribed_dofs, single_precision=True)(sK, sff, sup)
+            sc = pym.EinSum('i,i->')(su[0], su[1])
+
+        with pym.Network() as fn_double:  # Reference in double precision
+            sK_double = pym.AssembleStiffness(domain, matrix_type=fmt)(sx)
+            su_double = pym.SystemOfEquations(prescribed=prescribed_dofs)(sK_double, sff, sup)
+            sc_double = pym.EinSum('i,i->')(su_double[0], su_double[1])
+
+        # Compare the sensitivities to the ones in double precision
+        sens = []
+        for f, s_out in [(fn, sc), (fn_double, sc_double)]:
+            f.response()
+            f.reset()
+            s_out.sensitivity = 1.0
+            f.sensitivity()
+            sens.append([s.sensitivity.copy() for s in [sx, sff, sup]])
+        for ds, ds_double in zip(*sens):
+            assert ds.dtype == np.float64
+            npt.assert_allclose(ds, ds_double, rtol=1e-4, atol=1e-4 * np.max(np.abs(ds_double)))
+
+        def fd_testfn(x0, dx, df_an, df_fd):
+            npt.assert_allclose(df_an, df_fd, rtol=5e-2, atol=1e-2)
+
+        # The single-precision round-off in the response (~1e-6 relative) is amplified by 1/dx in the finite
+        # differences, which hides the small sensitivities to the prescribed values (checked against double above)
+        fn.reset()
+        pym.finite_difference([sx, sff], sc, function=fn, test_fn=fd_testfn, dx=1e-2, tol=5e-2, verbose=False)
+
     def test_sparse_symmetric_real_compliance2d_single_load_u(self):
         """ Test symmetric real sparse matrix (compliance in 2D)"""
         np.random.seed(0)
@@ -453,7 +571,41 @@ class TestSystemOfEquations:
 
         pym.finite_difference([sx, sff, sup], sc, test_fn=self.fd_testfn, dx=1e-5, tol=1e-4, verbose=False)
 
+    @pytest.mark.parametrize('fmt', ['csr', 'csc'])
+    def test_cached_partition(self, fmt):
+        """ Test repeated solves with cached partitioning, also when the sparsity pattern of the matrix changes """
+        np.random.seed(0)
+        n = 20
+        prescribed_dofs = np.array([5, 0, 13])
+        free_dofs = np.setdiff1d(np.arange(n), prescribed_dofs)
+
+        R = sp.random(n, n, density=0.2, random_state=0)
+        A = (R @ R.T + n * sp.eye(n)).asformat(fmt)
+        A_pattern = (A + 0.1 * (sp.eye(n, k=3) + sp.eye(n, k=-3))).asformat(fmt)
+
+        sK = pym.Signal('K', A)
+        sff = pym.Signal('ff', np.random.rand(free_dofs.size))
+        sup = pym.Signal('up', np.random.rand(prescribed_dofs.size))
+        m = pym.SystemOfEquations(prescribed=prescribed_dofs)
+        sx, sb = m(sK, sff, sup)
+        assert m.f.dtype == m.p.dtype == np.int32
+
+        for Ai in [A, 2.5 * A, A_pattern, 0.5 * A_pattern, A]:
+            sK.state = Ai
+            sff.state = np.random.rand(free_dofs.size)
+            m.response()
+
+            # Uncached reference solution
+            K = Ai.toarray()
+            x_ref = np.zeros(n)
+            x_ref[prescribed_dofs] = sup.state
+            x_ref[free_dofs] = np.linalg.solve(K[np.ix_(free_dofs, free_dofs)],
+                                               sff.state - K[np.ix_(free_dofs, prescribed_dofs)] @ sup.state)
+            npt.assert_allclose(sx.state, x_ref, rtol=1e-10)
+            npt.assert_allclose(sb.state, K @ x_ref, rtol=1e-10)
+
+        sc = pym.EinSum('i,i->')(sx, sb)
+        pym.finite_difference([sff, sup], sc, test_fn=self.fd_testfn, dx=1e-5, tol=1e-4, verbose=False)
 
 if __name__ == '__main__':
     pytest.main([__file__])
-
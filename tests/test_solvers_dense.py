@@ -125,6 +125,71 @@ def test_matrix_is_hermitian(Atag, expected):
     assert pym.solvers.matrix_is_hermitian(A) == expected
 
 
+@pytest.mark.parametrize('block_elements', [1, 24, 2**20])
+@pytest.mark.parametrize('iscomplex', [False, True])
+def test_dense_is_close_to_transpose_blocks(block_elements, iscomplex):
+    """ Symmetry checks in multiple blocks of rows, with the only asymmetric entries in later blocks """
+    from pymoto.solvers.matrix_checks import _dense_is_close_to_transpose
+    np.random.seed(0)
+    n = 12
+    A = np.random.rand(n, n) + (1j * np.random.rand(n, n) if iscomplex else 0)
+    Asymm = A + A.T
+    Aherm = A + A.conj().T
+    assert _dense_is_close_to_transpose(Asymm, block_elements=block_elements)
+    assert _dense_is_close_to_transpose(Aherm, conj=True, block_elements=block_elements)
+    assert _dense_is_close_to_transpose(Aherm, conj=False, block_elements=block_elements) == (not iscomplex)
+
+    for i, j in [(9, 11), (11, 9), (11, 10), (n - 1, n - 1)]:
+        for B, conj in [(Asymm.copy(), False), (Aherm.copy(), True)]:
+            if i == j:  # Only a complex diagonal entry makes the matrix non-Hermitian
+                if not (conj and iscomplex):
+                    continue
+                B[i, j] += 1e-3j
+            else:
+                B[i, j] += 1e-3
+            assert not _dense_is_close_to_transpose(B, conj=conj, block_elements=block_elements)
+
+
+@pytest.mark.parametrize('block_elements', [1, 2**20])
+def test_dense_is_close_to_transpose_tolerance(block_elements):
+    """ The relative tolerance is applied in both directions, as in ``np.allclose(A, A.T)`` """
+    from pymoto.solvers.matrix_checks import _dense_is_close_to_transpose
+    a, b = 1.0, 1.00001001005  # Close within the relative tolerance of b, but not of a
+    assert np.isclose(a, b) and not np.isclose(b, a)
+    for i, j in [(1, 3), (3, 1)]:
+        A = np.eye(4)
+        A[i, j], A[j, i] = a, b
+        assert not np.allclose(A, A.T)
+        assert not _dense_is_close_to_transpose(A, block_elements=block_elements)
+
+
+def test_matrix_is_symmetric_large():
+    """ A matrix that is large enough to be checked in multiple blocks with the default block size """
+    np.random.seed(0)
+    n = 1500
+    A = np.random.rand(n, n) + 1j * np.random.rand(n, n)
+    Asymm, Aherm = A + A.T, A + A.conj().T
+    assert pym.solvers.matrix_is_symmetric(Asymm)
+    assert pym.solvers.matrix_is_hermitian(Aherm)
+    assert not pym.solvers.matrix_is_hermitian(Asymm)
+    Asymm[n - 2, n - 1] += 1e-3  # Only asymmetric entry is in the last block
+    Aherm[n - 1, n - 2] += 1e-3
+    assert not pym.solvers.matrix_is_symmetric(Asymm)
+    assert not pym.solvers.matrix_is_hermitian(Aherm)
+
+
+@pytest.mark.parametrize('Atag', all_matrices.keys())
+def test_matrix_is_triangular(Atag):
+    A = all_matrices[Atag]
+    isdiagonal = pym.solvers.matrix_is_diagonal(A)
+    assert pym.solvers.matrix_is_lower_triangular(A) == isdiagonal
+    assert pym.solvers.matrix_is_upper_triangular(A) == isdiagonal
+    assert pym.solvers.matrix_is_lower_triangular(np.tril(A))
+    assert pym.solvers.matrix_is_upper_triangular(np.triu(A))
+    assert pym.solvers.matrix_is_lower_triangular(np.triu(A)) == isdiagonal
+    assert pym.solvers.matrix_is_upper_triangular(np.tril(A)) == isdiagonal
+
+
 @pytest.mark.parametrize('Atag', all_matrices.keys())
 def test_matrix_is_positive(Atag):
     A = all_matrices[Atag]
@@ -266,6 +331,10 @@ def run_solver_test(solver_type, A, b):
     npt.assert_allclose(A_N @ x_N - 0.9 * b, 0.0, atol=atol)
     assert not any(LDAsolver._did_solve)
 
+    # Stored right-hand-sides are contiguous vectors, independent of the batched product they are computed from
+    for bi in LDAsolver.b_stored + LDAsolver.badj_stored:
+        assert bi.flags.c_contiguous and bi.base is None
+
 
 def construct_b(b_type: str, b_shape: int, n: int):
     if b_shape is None:
@@ -378,6 +378,19 @@ def test_sparse_pardiso(Atag, b_type, b_shape, mat_converter):
     run_solver_test(pym.solvers.SolverSparsePardiso, A, b)
 
 
+@pytest.mark.parametrize('Atag', ['mat_real_symm_pos_def', 'mat_real_symm_indef', 'mat_real_asymm'])
+def test_sparse_pardiso_num_threads(Atag):
+    A = spsp.csr_matrix(all_matrices[Atag])
+    b = construct_b('realRHS', 3, A.shape[0])
+    run_solver_test(pym.solvers.SolverSparsePardiso, A, b, num_threads=1)
+
+    # The MKL thread setting is restored after the solves
+    libmkl = pym.solvers.sparse.libmkl
+    n_threads = libmkl.MKL_Get_Max_Threads()
+    pym.solvers.SolverSparsePardiso(A, num_threads=1).solve(b)
+    assert libmkl.MKL_Get_Max_Threads() == n_threads
+
+
 @pytest.mark.parametrize('b_shape', [None, 1, 3, 4], ids=['singleRHS', 'columnRHS', 'multiRHS', 'multiRHS_lindep'])
 @pytest.mark.parametrize('b_type', ['realRHS', 'complexRHS', 'imaginaryRHS'])
 @pytest.mark.parametrize('Atag', [